@@ -3,10 +3,13 @@
 @brief Core engine for simulating and evaluating A/B/n testing methodologies.
 
 This file contains the primary classes that power the simulation study:
-- Variant: Manages the state and data generation for a single experimental group.
+- VariantGroup: Manages the state and data generation for all experimental
+  groups as parallel arrays.
 - Methodology: A base class for different decision-making frameworks.
 - PeekingProxyMethod: Implements the flawed but common practice of peeking at
   p-values of a proxy metric (conversion rate).
+- compute_expected_losses: The numeric kernel of the Bayesian framework,
+  operating on plain arrays of per-variant sufficient statistics.
 - BayesianFramework: Implements the proposed profit-driven Bayesian framework
   using a two-part model for RPV and a decision rule based on Expected Loss.
 - Simulation: Orchestrates the execution of single or multiple simulation runs.
@@ -14,59 +17,100 @@ This file contains the primary classes that power the simulation study:
 
 import numpy as np
 import pandas as pd
-from scipy import stats as sps
-from statsmodels.stats.proportion import proportions_ztest
+from joblib import Parallel, delayed
+from scipy.special import ndtr
 from tqdm import tqdm
 
 
-class Variant:
-    """Represents a single variant in an experiment."""
+class VariantGroup:
+    """
+    Represents all variants in an experiment as parallel arrays.
+
+    Entry i of every array belongs to the variant named `names[i]`, so the
+    daily data generation and the methodologies' checks operate on whole
+    arrays instead of one Variant object at a time.
+    """
 
-    def __init__(self, name, true_conv_rate, true_aov, aov_std_dev):
+    def __init__(self, names, true_conv_rate, gamma_shape, gamma_scale):
         """
-        Initializes a variant with its ground-truth parameters.
+        Initializes the variants with their ground-truth parameters.
+
+        The parameter arrays are scenario constants prepared once by
+        Simulation and shared, read-only, by every run.
 
         Args:
-            name (str): The name of the variant (e.g., 'A', 'B').
-            true_conv_rate (float): The true probability of conversion.
-            true_aov (float): The true average order value.
-            aov_std_dev (float): The standard deviation of order values.
+            names (list[str]): The names of the variants (e.g., ['A', 'B']).
+            true_conv_rate (np.ndarray): The true probability of conversion.
+            gamma_shape (np.ndarray): Shape of each variant's order value distribution.
+            gamma_scale (np.ndarray): Scale of each variant's order value distribution.
         """
-        self.name = name
+        self.names = names
         self.true_conv_rate = true_conv_rate
-        self.true_aov = true_aov
-
-        # Pre-calculate Gamma distribution parameters for efficient revenue generation
-        variance = aov_std_dev**2
-        self.gamma_scale = variance / self.true_aov
-        self.gamma_shape = self.true_aov / self.gamma_scale
+        self.gamma_shape = gamma_shape
+        self.gamma_scale = gamma_scale
 
         # Accumulated observational data
-        self.visitors = 0
-        self.conversions = 0
-        self.conversion_revenues = []
+        n_variants = len(self.names)
+        self.visitors = np.zeros(n_variants, dtype=np.int64)
+        self.conversions = np.zeros(n_variants, dtype=np.int64)
+        # Running sufficient statistics of conversion revenues (sum, sum of squares)
+        self.rev_sum = np.zeros(n_variants)
+        self.rev_sumsq = np.zeros(n_variants)
 
-    def add_visitors(self, n_visitors):
-        """Simulates n new visitors arriving at this variant."""
-        # Simulate new conversions based on the true conversion rate
-        new_conversions = np.random.binomial(n_visitors, self.true_conv_rate)
+    def __len__(self):
+        return len(self.names)
+
+    def draw_traffic(self, n_visitors, n_days, rng):
+        """
+        Pre-generates all the data for up to n_days of traffic.
 
-        self.visitors += n_visitors
-        self.conversions += new_conversions
+        Every day brings n_visitors new visitors to each variant. The daily
+        conversions for all days are drawn in one call, followed by exactly
+        as many order values as there are conversions per variant, so the
+        simulation loop needs no further random draws.
 
-        # Generate revenue values only for the visitors who converted
-        new_revenues = np.random.gamma(
-            self.gamma_shape, self.gamma_scale, new_conversions
+        Args:
+            n_visitors (int): Visitors per variant per day.
+            n_days (int): Number of days of traffic to generate.
+            rng (np.random.Generator): Source of randomness for this run.
+        """
+        self.daily_visitors = n_visitors
+        self.daily_conversions = rng.binomial(
+            n_visitors, self.true_conv_rate, (n_days, len(self))
+        )
+
+        # Order values for all variants come from one (V, m) draw, where m is the
+        # largest conversion total; row i only ever reads its first total_i
+        # entries, so the surplus draws of lower-converting variants go unused.
+        # Prefix sums of the order values (and their squares) make the revenue
+        # statistics after c conversions a single lookup at column c.
+        n_draws = self.daily_conversions.sum(axis=0).max()
+        revenues = rng.gamma(
+            self.gamma_shape[:, None], self.gamma_scale[:, None], (len(self), n_draws)
         )
-        self.conversion_revenues.extend(new_revenues)
+        self._rev_cumsum = np.zeros((len(self), n_draws + 1))
+        self._rev_cumsumsq = np.zeros((len(self), n_draws + 1))
+        np.cumsum(revenues, axis=1, out=self._rev_cumsum[:, 1:])
+        np.cumsum(revenues**2, axis=1, out=self._rev_cumsumsq[:, 1:])
+        self.days_elapsed = 0
+
+    def advance_day(self):
+        """Simulates the next pre-generated day of visitors arriving at each variant."""
+        self.visitors += self.daily_visitors
+        self.conversions += self.daily_conversions[self.days_elapsed]
+        self.days_elapsed += 1
+
+        rows = np.arange(len(self))
+        self.rev_sum = self._rev_cumsum[rows, self.conversions]
+        self.rev_sumsq = self._rev_cumsumsq[rows, self.conversions]
 
 
 class Methodology:
     """Base class for all testing methodologies."""
 
     def __init__(self, variants, name):
-        """Initializes a methodology with a set of variants."""
-        self.variants = {v.name: v for v in variants}
+        """Initializes a methodology with a VariantGroup."""
+        self.variants = variants
         self.name = name
         self.is_stopped = False
         self.decision = "N/A (Timed Out)"
@@ -83,41 +127,176 @@ class PeekingProxyMethod(Methodology):
     proxy metric (conversion rate) in an A/B/n context.
     """
 
+    def __init__(self, variants, name):
+        """Initializes the method and locates the control among the variants."""
+        super().__init__(variants, name)
+        # Positions are fixed for the whole run, so resolve them only once
+        names = variants.names
+        self.control = names.index('A') if 'A' in names else None
+        self.challengers = np.flatnonzero([n != 'A' for n in names])
+        self.challenger_names = [names[i] for i in self.challengers]
+
     def run_check(self, day):
         """
         Performs a two-proportion Z-test for each variant against the control.
         Stops at the first variant that shows a p-value < 0.05.
         """
-        if self.is_stopped:
+        if self.is_stopped or self.control is None:
             return
 
-        control = self.variants.get('A')
-        if not control or control.visitors == 0:
+        control_conversions = self.variants.conversions[self.control]
+        control_visitors = self.variants.visitors[self.control]
+        if control_visitors == 0:
             return
 
-        for name, variant in self.variants.items():
-            if name == 'A':
-                continue
+        conversions = self.variants.conversions[self.challengers]
+        visitors = self.variants.visitors[self.challengers]
+
+        # Pooled two-proportion Z-test of every variant against the control at once
+        rates = conversions / visitors
+        control_rate = control_conversions / control_visitors
+        pooled = (conversions + control_conversions) / (visitors + control_visitors)
+        std_err = np.sqrt(pooled * (1 - pooled) * (1 / visitors + 1 / control_visitors))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            z_scores = (rates - control_rate) / std_err
+        # One-sided p-value for the variant being better than the control
+        p_values = ndtr(-z_scores)
+
+        # Ensure sufficient data and only consider variants that look better
+        significant = (
+            (conversions >= 5) & (control_conversions >= 5)
+            & (rates > control_rate) & (p_values < 0.05)
+        )
+        if significant.any():
+            # Stop at the first significant winner
+            self.is_stopped = True
+            self.decision = f"Declared '{self.challenger_names[np.argmax(significant)]}' winner"
+            self.stop_day = day
+
+
+def _value_posterior(conversions, rev_sum, rev_sumsq):
+    """
+    Computes the Student-T marginal posterior of the mean order value.
+
+    Returns the (loc, scale, df) arrays of the Normal-Inverse-Gamma model's
+    marginal posterior for 'mu', one entry per variant. Entries for variants
+    with fewer than two conversions are not meaningful; callers fall back to
+    the wide prior for those.
+    """
+    # Priors for the value model (mean and variance of revenue)
+    mu_0, n_0, alpha_0, beta_0 = 100.0, 1.0, 1.0, 1.0
+    k = np.maximum(conversions, 1)
+    x_bar = rev_sum / k
+    ssd = rev_sumsq - k * x_bar**2
+
+    # Posterior parameters for the NIG distribution
+    mu_k = (n_0 * mu_0 + k * x_bar) / (n_0 + k)
+    n_k = n_0 + k
+    alpha_k = alpha_0 + k / 2.0
+    beta_k = beta_0 + 0.5 * ssd + (k * n_0 / (n_0 + k)) * 0.5 * (x_bar - mu_0)**2
+
+    # Marginal posterior for the mean 'mu' is a Student-T distribution
+    scale_t = np.sqrt(beta_k / (alpha_k * n_k))
+    df_t = 2 * alpha_k
+    return mu_k, scale_t, df_t
 
-            # Ensure sufficient data to avoid statistical errors
-            if variant.conversions < 5 or control.conversions < 5:
-                continue
 
-            counts = np.array([variant.conversions, control.conversions])
-            nobs = np.array([variant.visitors, control.visitors])
+def expected_loss_lower_bound(visitors, conversions, rev_sum, rev_sumsq):
+    """
+    Cheaply approximates a lower bound on each variant's Expected Loss.
+
+    Since max_i(X_i) - X_j >= (X_i - X_j)+ for every i, the Expected Loss of
+    variant j is at least max_i E[(X_i - X_j)+]. Each pairwise term is
+    evaluated in closed form by approximating the RPV difference as Normal,
+    using the exact posterior means and variances of RPV = p * mu.
 
-            # Use a one-sided test to check if the variant is better
-            if counts[0] / nobs[0] > counts[1] / nobs[1]:
-                try:
-                    _, p_value = proportions_ztest(counts, nobs, alternative='larger')
-                    if p_value < 0.05:
-                        self.is_stopped = True
-                        self.decision = f"Declared '{name}' winner"
-                        self.stop_day = day
-                        return  # Stop at the first significant winner
-                except Exception:
-                    # Ignore potential statistical errors from low data counts
-                    pass
+    Args are the same per-variant arrays as compute_expected_losses.
+
+    Returns:
+        np.ndarray: The approximate lower bound for each variant.
+    """
+    # Moments of the Beta posterior for the conversion rate
+    conv_alpha = 1.0 + conversions
+    conv_beta = 1.0 + (visitors - conversions)
+    ab = conv_alpha + conv_beta
+    p_mean = conv_alpha / ab
+    p_var = conv_alpha * conv_beta / (ab**2 * (ab + 1.0))
+
+    # Moments of the posterior mean order value (wide prior below two conversions)
+    mu_k, scale_t, df_t = _value_posterior(conversions, rev_sum, rev_sumsq)
+    has_data = conversions > 1
+    mu_mean = np.where(has_data, mu_k, 100.0)
+    mu_var = np.where(has_data, scale_t**2 * df_t / (df_t - 2.0), 50.0**2)
+
+    # Moments of RPV = p * mu for independent p and mu
+    rpd_mean = p_mean * mu_mean
+    rpd_var = (p_var + p_mean**2) * (mu_var + mu_mean**2) - rpd_mean**2
+
+    # E[(X_i - X_j)+] for a Normal difference, indexed [i, j]
+    diff_mean = rpd_mean[:, None] - rpd_mean[None, :]
+    diff_sd = np.sqrt(rpd_var[:, None] + rpd_var[None, :])
+    z = diff_mean / diff_sd
+    positive_part = diff_sd * np.exp(-0.5 * z**2) / np.sqrt(2 * np.pi) + diff_mean * ndtr(z)
+    np.fill_diagonal(positive_part, 0.0)
+    return positive_part.max(axis=0)
+
+
+def compute_expected_losses(visitors, conversions, rev_sum, rev_sumsq, S, rng):
+    """
+    Computes the posterior Expected Loss of choosing each variant.
+
+    This is the numeric kernel of the Bayesian framework. It works on plain
+    length-V arrays of sufficient statistics, as held by a VariantGroup.
+
+    Args:
+        visitors (np.ndarray): Visitors observed per variant.
+        conversions (np.ndarray): Conversions observed per variant.
+        rev_sum (np.ndarray): Sum of conversion revenues per variant.
+        rev_sumsq (np.ndarray): Sum of squared conversion revenues per variant.
+        S (int): Number of Monte Carlo samples.
+        rng (np.random.Generator): Source of randomness for the samples.
+
+    Returns:
+        np.ndarray: The Expected Loss of each variant, in input order.
+    """
+    n_variants = len(visitors)
+
+    # 1. Conversion Model (Beta-Binomial)
+    # Posterior for conversion rate 'p' is Beta(1+k, 1+N-k); one broadcast
+    # draw produces the samples for every variant at once.
+    conv_alpha = 1.0 + conversions
+    conv_beta = 1.0 + (visitors - conversions)
+    # Samples are kept in float32: the Monte Carlo noise of the Expected Loss is
+    # far above float32 precision, and it halves the memory traffic of the
+    # reductions below.
+    p_mat = rng.beta(conv_alpha[:, None], conv_beta[:, None], (n_variants, S))
+    p_mat = p_mat.astype(np.float32)
+
+    # 2. Value Model (Normal-Inverse-Gamma -> Student-T posterior for mean)
+    # Both the posterior and the fallback prior are symmetric, so the mean
+    # order value is sampled with antithetic pairs loc +/- scale * z, which
+    # halves the number of draws and reduces the estimator's variance.
+    mu_k, scale_t, df_t = _value_posterior(conversions, rev_sum, rev_sumsq)
+    n_half = (S + 1) // 2
+    z = rng.standard_t(df_t[:, None], (n_variants, n_half)).astype(np.float32)
+
+    # If there's not enough data, draw from a wide prior centered at 100
+    has_data = conversions > 1
+    if not has_data.all():
+        z[~has_data] = rng.standard_normal(
+            (np.count_nonzero(~has_data), n_half), dtype=np.float32
+        )
+    loc = np.where(has_data, mu_k, 100.0).astype(np.float32)
+    scale = np.where(has_data, scale_t, 50.0).astype(np.float32)
+    mu_mat = loc[:, None] + scale[:, None] * np.concatenate([z, -z], axis=1)[:, :S]
+
+    # 3. Combine posteriors to get RPV = p * mu (one row per variant)
+    rpd = p_mat * mu_mat
+
+    # 4. Decision Theory: Calculate Expected Loss
+    max_rpd_per_draw = rpd.max(axis=0)
+    # Accumulate the mean in float64 so the S-length sums do not lose precision
+    return (max_rpd_per_draw[None, :] - rpd).mean(axis=1, dtype=np.float64)
 
 
 class BayesianFramework(Methodology):
@@ -126,11 +305,22 @@ class BayesianFramework(Methodology):
     decision-theoretic stopping rule based on Expected Loss.
     """
 
-    def __init__(self, variants, name, epsilon=0.001, S=20000):
-        """Initializes the framework with a loss threshold and sample size."""
+    def __init__(self, variants, name, epsilon=0.001, S=20000, gate_factor=3.0, rng=None):
+        """
+        Initializes the framework with a loss threshold and sample size.
+
+        The full Monte Carlo check is skipped on days where the closed-form
+        lower bound on Expected Loss exceeds `gate_factor * epsilon`, as the
+        stopping rule cannot trigger then. Pass `gate_factor=None` to run it
+        every day. Posterior samples are drawn from `rng`, a fresh unseeded
+        Generator by default.
+        """
         super().__init__(variants, name)
         self.epsilon = epsilon
         self.S = S  # Number of Monte Carlo samples
+        self.gate_factor = gate_factor
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.expected_losses = None  # Latest Expected Loss array, for logging
 
     def run_check(self, day):
         """
@@ -140,87 +330,145 @@ class BayesianFramework(Methodology):
         if self.is_stopped:
             return
 
-        rpd_samples = {}
-        for name, variant in self.variants.items():
-            # 1. Conversion Model (Beta-Binomial)
-            # Posterior for conversion rate 'p' is Beta(1+k, 1+N-k)
-            conv_alpha = 1.0 + variant.conversions
-            conv_beta = 1.0 + (variant.visitors - variant.conversions)
-            p_samples = np.random.beta(conv_alpha, conv_beta, self.S)
-
-            # 2. Value Model (Normal-Inverse-Gamma -> Student-T posterior for mean)
-            if variant.conversions > 1:
-                # Priors for the value model (mean and variance of revenue)
-                mu_0, n_0, alpha_0, beta_0 = 100.0, 1.0, 1.0, 1.0
-                k = variant.conversions
-                x_bar = np.mean(variant.conversion_revenues)
-                ssd = np.sum((np.array(variant.conversion_revenues) - x_bar)**2)
-
-                # Posterior parameters for the NIG distribution
-                mu_k = (n_0 * mu_0 + k * x_bar) / (n_0 + k)
-                n_k = n_0 + k
-                alpha_k = alpha_0 + k / 2.0
-                beta_k = beta_0 + 0.5 * ssd + (k * n_0 / (n_0 + k)) * 0.5 * (x_bar - mu_0)**2
-
-                # Marginal posterior for the mean 'mu' is a Student-T distribution
-                scale_t = np.sqrt(beta_k / (alpha_k * n_k))
-                df_t = 2 * alpha_k
-                mu_samples = sps.t.rvs(df=df_t, loc=mu_k, scale=scale_t, size=self.S)
-            else:
-                # If there's not enough data, draw from a wide prior centered at 100
-                mu_samples = sps.norm.rvs(loc=100, scale=50, size=self.S)
-
-            # 3. Combine posteriors to get RPV = p * mu
-            rpd_samples[name] = p_samples * mu_samples
+        stats = (
+            self.variants.visitors,
+            self.variants.conversions,
+            self.variants.rev_sum,
+            self.variants.rev_sumsq,
+        )
 
-        # 4. Decision Theory: Calculate Expected Loss
-        all_samples_df = pd.DataFrame(rpd_samples)
-        max_rpd_per_draw = all_samples_df.max(axis=1)
+        # Skip the expensive Monte Carlo step while stopping is clearly out of reach
+        if self.gate_factor is not None:
+            lower_bound = expected_loss_lower_bound(*stats)
+            if lower_bound.min() > self.gate_factor * self.epsilon:
+                self.expected_losses = None
+                return
 
-        expected_losses = {}
-        for name in self.variants:
-            loss_samples = max_rpd_per_draw - all_samples_df[name]
-            expected_losses[name] = loss_samples.mean()
+        losses = compute_expected_losses(*stats, self.S, self.rng)
+        self.expected_losses = losses
 
         # Find the variant with the minimum expected loss (the current best choice)
-        min_loss_variant = min(expected_losses, key=expected_losses.get)
-        min_loss_value = expected_losses[min_loss_variant]
+        best = np.argmin(losses)
 
         # 5. Stopping Rule
-        if min_loss_value < self.epsilon:
+        if losses[best] < self.epsilon:
             self.is_stopped = True
             self.stop_day = day
-            if min_loss_variant == 'A':
+            # Positions are only mapped back to a variant name for the decision
+            best_variant = self.variants.names[best]
+            if best_variant == 'A':
                 self.decision = "Stopped for Futility"
             else:
-                self.decision = f"Declared '{min_loss_variant}' winner"
+                self.decision = f"Declared '{best_variant}' winner"
 
 
 class Simulation:
     """Orchestrates the running and aggregation of simulation results."""
 
     def __init__(self, config):
-        """Initializes the simulation with a specific scenario config."""
+        """
+        Initializes the simulation with a specific scenario config.
+
+        Scenario-level arrays are derived here once and reused by every run.
+        """
         self.config = config
+        variant_configs = config['variants']
+        self.names = [v['name'] for v in variant_configs]
+        self.true_conv_rate = np.array([v['true_conv_rate'] for v in variant_configs])
+
+        # Pre-calculate Gamma distribution parameters for efficient revenue generation
+        true_aov = np.array([v['true_aov'] for v in variant_configs])
+        variance = np.array([v['aov_std_dev'] for v in variant_configs])**2
+        self.gamma_scale = variance / true_aov
+        self.gamma_shape = true_aov / self.gamma_scale
+
+        self.daily_visitors = config['daily_total_visitors'] // len(self.names)
 
-    def run_single_simulation(self, max_days=200, log_daily=False):
+    def run_single_simulation(self, max_days=200, log_daily=False, seed=None):
         """
         Runs a single end-to-end simulation for a maximum number of days.
+
+        All randomness in the run comes from one PCG64 Generator built from
+        `seed` (an int or SeedSequence), so a seeded run is reproducible.
         """
-        variants = [Variant(**v_config) for v_config in self.config['variants']]
+        rng = np.random.default_rng(seed)
+        variants = VariantGroup(
+            self.names, self.true_conv_rate, self.gamma_shape, self.gamma_scale
+        )
         methodologies = [
             PeekingProxyMethod(variants, name="Peeking (Proxy)"),
-            BayesianFramework(variants, name="Bayesian Framework", epsilon=self.config['epsilon'])
+            # Disable gating when logging so every day's Expected Loss is recorded
+            BayesianFramework(variants, name="Bayesian Framework", epsilon=self.config['epsilon'],
+                              gate_factor=None if log_daily else 3.0, rng=rng)
         ]
         
         daily_log_data = []
 
+        variants.draw_traffic(self.daily_visitors, max_days, rng)
+
         for day in range(1, max_days + 1):
-            daily_visitors = self.config['daily_total_visitors'] // len(variants)
-            for variant in variants:
-                variant.add_visitors(daily_visitors)
+            variants.advance_day()
 
             for method in methodologies:
                 method.run_check(day)
             
-            if log_daily and not methodolog
+            bayesian = methodologies[1]
+            if log_daily and not (bayesian.is_stopped and bayesian.stop_day < day):
+                log_entry = {'day': day}
+                for name, rpv in zip(variants.names, variants.rev_sum / variants.visitors):
+                    log_entry[f'RPV_{name}'] = rpv
+                if bayesian.expected_losses is not None:
+                    for name, loss in zip(variants.names, bayesian.expected_losses):
+                        log_entry[f'EL_{name}'] = loss
+                daily_log_data.append(log_entry)
+
+            if all(m.is_stopped for m in methodologies):
+                break
+
+        results = {
+            m.name: {
+                'decision': m.decision,
+                'stop_day': m.stop_day if m.is_stopped else max_days,
+            }
+            for m in methodologies
+        }
+        return results, pd.DataFrame(daily_log_data)
+
+    def run_multiple_simulations(self, n_runs=1000, max_days=200, seed=None, n_jobs=-1):
+        """
+        Runs many independent simulations in parallel and aggregates the results.
+
+        Runs are dispatched through joblib's loky backend, whose worker pool is
+        kept alive and reused by subsequent calls (e.g. across case studies).
+        Each run receives its own child of a master SeedSequence, so runs are
+        statistically independent regardless of which worker executes them,
+        and the whole batch is reproducible when `seed` is given.
+        """
+        seeds = np.random.SeedSequence(seed).spawn(n_runs)
+        parallel = Parallel(n_jobs=n_jobs, batch_size='auto', return_as='generator_unordered')
+        runs = parallel(delayed(_one_run)(self, max_days, s) for s in seeds)
+        all_results = list(tqdm(runs, total=n_runs, desc=self.config['name']))
+
+        # Aggregate results for each methodology from one flat table of outcomes
+        outcomes = pd.DataFrame.from_records(
+            [{'method': name, **outcome} for result in all_results for name, outcome in result.items()]
+        )
+        summary = {}
+        for method_name, runs in outcomes.groupby('method', sort=False):
+            summary[method_name] = {
+                'Avg. Duration (days)': runs['stop_day'].mean(),
+                'Decision %': runs['decision'].value_counts(normalize=True).rename_axis(None) * 100,
+            }
+        return summary
+
+
+def _one_run(simulation, max_days, seed_seq):
+    """
+    Executes a single simulation in a worker process.
+
+    Defined at module level so it can be pickled for the worker pool. The
+    run draws from its own Generator seeded by `seed_seq`, so results do not
+    depend on which worker executes it.
+    """
+    results, _ = simulation.run_single_simulation(max_days=max_days, seed=seed_seq)
+    return results